@@ -37,6 +37,8 @@ class DevInfo:
         else:  # REPL
             self._repo = os.getcwd()
 
+        self._info = None  # computed on first successful get()
+
     def get(self):
 
         # {
@@ -66,7 +68,13 @@ class DevInfo:
         #     }
         # }
 
-        try:
-            return get_software_info(self._repo)
-        except Exception:
-            return {}
+        # the info reflects the state of the codebase at process start,
+        # it cannot change while running, so gathering it once is enough.
+        # collecting it involves git subprocess calls and a scan of the
+        # installed packages, too slow to repeat on every ?dev request.
+        if self._info is None:
+            try:
+                self._info = get_software_info(self._repo)
+            except Exception:
+                return {}  # try again next time
+        return self._info
@@ -2,6 +2,7 @@ from collections import defaultdict
 
 from biothings.web.analytics.channels import SlackChannel, GAChannel
 from tornado.httpclient import AsyncHTTPClient
+from tornado.ioloop import IOLoop
 from tornado.web import RequestHandler
 
 
@@ -55,14 +56,20 @@ class AnalyticsMixin(RequestHandler):
         self.event["__request__"] = request
 
         if hasattr(self, 'biothings'):
-            client = AsyncHTTPClient()
-            notifier = self.biothings.notifier
-            for request in notifier.broadcast(self.event):
-                client.fetch(request)
+            # building the tracking payloads involves some CPU work
+            # per channel, defer it to a later iteration of the event
+            # loop so that finishing a request stays cheap under load
+            IOLoop.current().add_callback(self._broadcast, self.event)
 
         else:  # need to initialize a notifier
             raise NotImplementedError()
 
+    def _broadcast(self, event):
+        client = AsyncHTTPClient()
+        notifier = self.biothings.notifier
+        for request in notifier.broadcast(event):
+            client.fetch(request)
+
 
 # FastAPI
 
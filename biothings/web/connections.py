@@ -7,10 +7,12 @@ from functools import partial
 import boto3
 import elasticsearch
 import elasticsearch_dsl
+import orjson
 import requests
 from biothings.utils.common import run_once
 from elasticsearch import AIOHttpConnection
 from elasticsearch import RequestsHttpConnection as _Conn
+from elasticsearch.serializer import JSONSerializer
 from requests_aws4auth import AWS4Auth
 from tornado.ioloop import IOLoop
 
@@ -57,6 +59,28 @@ def _log_es(client, hosts):
 # ------------------------
 
 
+class _OrjsonSerializer(JSONSerializer):
+    # encode request bodies and decode response payloads with orjson,
+    # which is considerably faster than the stdlib json module used
+    # by the client default, a visible difference on large responses.
+    # inherits the non-json mimetype handling and the default() hook
+    # covering additional types from the base class.
+
+    def loads(self, s):
+        try:
+            return orjson.loads(s)
+        except (ValueError, TypeError) as e:
+            raise elasticsearch.SerializationError(s, e)
+
+    def dumps(self, data):
+        if isinstance(data, str):  # already serialized
+            return data
+        try:
+            return orjson.dumps(data, default=self.default).decode()
+        except (ValueError, TypeError) as e:
+            raise elasticsearch.SerializationError(data, e)
+
+
 class _AsyncConn(AIOHttpConnection):
     def __init__(self, *args, **kwargs):
         self.aws_auth = None
@@ -128,6 +152,8 @@ def get_es_client(hosts=None, async_=False, **settings):
         settings.setdefault('sniff_on_connection_fail', True)
         settings.setdefault('sniffer_timeout', 60)
 
+    settings.setdefault('serializer', _OrjsonSerializer())
+
     if async_:
         from elasticsearch import AsyncElasticsearch
         client = AsyncElasticsearch
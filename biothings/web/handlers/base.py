@@ -22,6 +22,11 @@ import orjson
 import logging
 
 import yaml
+
+try:
+    from functools import cached_property  # py>=3.8
+except ImportError:
+    cached_property = property
 from biothings.utils import serializer
 from biothings.web.analytics.events import Event
 from biothings.web.analytics.notifiers import AnalyticsMixin
@@ -31,9 +36,20 @@ from tornado.web import HTTPError, RequestHandler
 
 logger = logging.getLogger(__name__)
 
+# base structure of an error response,
+# copied and filled in per write_error call
+_ERROR_TEMPLATE = {
+    "code": None,
+    "success": False,
+    "error": None
+}
+
 class BaseHandler(RequestHandler):
 
-    @property
+    # handlers are instantiated per request and this attribute is
+    # accessed many times during one, caching it turns the repeated
+    # property and application lookups into one dict access.
+    @cached_property
     def biothings(self):
         return self.application.biothings
 
@@ -149,7 +165,9 @@ class BaseAPIHandler(BaseHandler, AnalyticsMixin):
         try:
 
             if self.format == "json":
-                chunk = serializer.to_json(chunk)
+                # write the orjson-encoded bytes directly, avoiding
+                # a bytes -> str -> bytes round trip in tornado
+                chunk = serializer.to_json_bytes(chunk)
                 self.set_header("Content-Type", "application/json; charset=UTF-8")
 
             elif self.format == "yaml":
@@ -203,14 +221,16 @@ class BaseAPIHandler(BaseHandler, AnalyticsMixin):
         reason = kwargs.pop('reason', self._reason)
         # "reason" is a reserved tornado keyword
         # see RequestHandler.send_error
-        assert isinstance(reason, str)
-        assert '\n' not in reason
-
-        message = {
-            "code": status_code,
-            "success": False,
-            "error": reason
-        }
+        if not isinstance(reason, str):
+            reason = str(reason)
+        if '\n' in reason:
+            # tornado does not allow newlines in the
+            # reason phrase of the http status line
+            reason = reason.replace('\n', ' ')
+
+        message = dict(_ERROR_TEMPLATE)
+        message["code"] = status_code
+        message["error"] = reason
         try:  # merge exception info
             exception = kwargs['exc_info'][1]
             message.update(exception.args[0]) # <-
@@ -50,6 +50,11 @@ __all__ = [
 
 logger = logging.getLogger(__name__)
 
+# event categories and actions are fully determined by the app version,
+# the endpoint name and the request method, none of which change at
+# runtime, so each combination is built once and reused afterwards.
+_EVENT_FIELDS = {}  # (version, name, method) -> (category, action)
+
 
 class BaseQueryHandler(BaseAPIHandler):
 
@@ -66,10 +71,19 @@ class BaseQueryHandler(BaseAPIHandler):
         # provide convenient access to next stages
         self.args.biothing_type = self.biothing_type
 
+        key = (self.biothings.config.APP_VERSION, self.name, self.request.method)
+        try:
+            category, action = _EVENT_FIELDS[key]
+        except KeyError:
+            category, action = _EVENT_FIELDS.setdefault(key, (
+                '{}_api'.format(key[0]),  # eg.'v1_api'
+                '_'.join((self.name, self.request.method.lower()))  # eg.'query_get'
+            ))
+
         self.event = GAEvent({
             '__secondary__': [],  # secondary analytical objective: field tracking
-            'category': '{}_api'.format(self.biothings.config.APP_VERSION),  # eg.'v1_api'
-            'action': '_'.join((self.name, self.request.method.lower())),  # eg.'query_get'
+            'category': category,
+            'action': action,
             # 'label': 'fetch_all', etc.
             # 'value': 100, # number of queries
         })
@@ -249,6 +263,10 @@ class QueryHandler(BaseQueryHandler):
     '''
     name = 'query'
 
+    # responses with at least this many hits are written out
+    # incrementally instead of buffered in one finish call
+    STREAM_HITS_MIN = 1000
+
     @capture_exceptions
     async def post(self, *args, **kwargs):
         self.event['value'] = len(self.args['q'])
@@ -270,4 +288,29 @@ class QueryHandler(BaseQueryHandler):
 
         response = await ensure_awaitable(
             self.pipeline.search(**self.args))
+
+        if self.format == 'json' and isinstance(response, dict) and \
+                len(response.get('hits') or ()) >= self.STREAM_HITS_MIN:
+            return self._finish_stream(response)
         self.finish(response)
+
+    def _finish_stream(self, response):
+        # serialize and write the hits one by one, flushing the
+        # connection periodically, so the full response body never
+        # needs to be buffered in memory at once. mainly benefits
+        # fetch_all/scroll batches carrying thousands of hits and
+        # also improves the time to first byte for those requests.
+        hits = response.pop('hits')
+        head = serializer.to_json_bytes(response)
+
+        self.set_header('Content-Type', 'application/json; charset=UTF-8')
+        write = super(BaseAPIHandler, self).write  # skip re-serialization
+        write(head[:-1] + b',"hits":[' if head != b'{}' else b'{"hits":[')
+        for index, hit in enumerate(hits):
+            if index:
+                write(b',')
+            write(serializer.to_json_bytes(hit))
+            if index % self.STREAM_HITS_MIN == 0:
+                self.flush()
+        write(b']}')
+        self.finish()
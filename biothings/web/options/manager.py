@@ -2,12 +2,10 @@
 Request Argument Standardization
 """
 
-import copy
 import orjson
 import logging
 import re
-from collections import UserDict, abc, defaultdict, namedtuple
-from functools import partial
+from collections import UserDict, abc, defaultdict
 from pprint import pformat
 from types import MappingProxyType
 
@@ -237,7 +235,9 @@ class FormArgCvter(Converter):
             try:  # attempt to load as json first
                 _value = orjson.loads(value)
             except orjson.JSONDecodeError as exc:
-                logging.debug(repr(exc))
+                # defer the repr call to the logging framework
+                # so it only runs when DEBUG records are emitted
+                logging.debug("%r", exc)
             else:  # no more conversions
                 if isinstance(_value, to_type):
                     return _value
@@ -284,6 +284,7 @@ class JsonArgCvter(Converter):
 
 
 class ReqResult(dotdict):
+    __slots__ = ()
 
     # besides multi-level attribute(dot)
     # read and write access, this class
@@ -576,6 +577,7 @@ class Option(UserDict):
         self._exists = Existentialist(self)
         self._typify = dict(Converter.subclasses(self))
         self._validator = Validator(self)
+        self._absent = None  # cached parse result for missing input
 
         # default argument parsing location order
         self.order = self.get("location", None)
@@ -599,10 +601,18 @@ class Option(UserDict):
             src=True)
 
         if val is None:
-            val = self._exists.inquire(val)
-        else:  # type conversion and transform
-            val = self._typify[loc].convert(val)
-            val = self._typify[loc].translate(val)
+            # the outcome for a missing argument is fully determined
+            # by the option definition, which does not change between
+            # requests, so it only needs to be computed once.
+            if self._absent is None:
+                val = self._exists.inquire(val)
+                val = self._validator.validate(val)
+                self._absent = (val, )
+            return self._absent[0]
+
+        # type conversion and transform
+        val = self._typify[loc].convert(val)
+        val = self._typify[loc].translate(val)
 
         # additional conditions
         val = self._validator.validate(val)
@@ -34,6 +34,7 @@ import os
 import re
 from collections import UserString, namedtuple
 from copy import deepcopy
+from functools import lru_cache
 from random import randrange
 
 import orjson
@@ -73,7 +74,13 @@ class QStringParser:
                 assert isinstance(pattern, re.Pattern)
             self.patterns.append((pattern, fields))
 
-    def parse(self, q):
+        # query strings repeat a lot across requests (popular ids,
+        # autocomplete bursts...) while the pattern list is fixed,
+        # so memoize the regex matching per parser instance. the
+        # returned namedtuple is never mutated by the callers.
+        self.parse = lru_cache(maxsize=1024)(self._parse)
+
+    def _parse(self, q):
         assert isinstance(q, str)
         for regex, fields in self.patterns:
             match = re.fullmatch(regex, q)
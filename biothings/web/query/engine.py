@@ -24,7 +24,8 @@
 import asyncio
 
 from biothings.web.query.builder import ESScrollID
-from elasticsearch import NotFoundError, RequestError
+from elasticsearch import NotFoundError, RequestError, TransportError
+from elasticsearch.exceptions import HTTP_EXCEPTIONS
 from elasticsearch_dsl import MultiSearch, Search
 
 
@@ -77,7 +78,8 @@ class AsyncESQueryBackend(ESQueryBackend):
         self, client, indices=None,
         scroll_time='1m', scroll_size=1000,
         multisearch_concurrency=5,
-        total_hits_as_int=True
+        total_hits_as_int=True,
+        batch_window=0, batch_size=16
     ):
         super().__init__(client, indices)
 
@@ -88,6 +90,18 @@ class AsyncESQueryBackend(ESQueryBackend):
         # concurrency control
         self.semaphore = asyncio.Semaphore(multisearch_concurrency)
 
+        # micro-batching of concurrent searches
+        # -------------------------------------
+        # under load many requests target the same index within a few
+        # milliseconds. when batch_window (in seconds) is set, plain
+        # searches arriving within that window are merged into one
+        # msearch request and the responses are demultiplexed, cutting
+        # the number of ES round trips. off by default because it adds
+        # up to batch_window of latency to every batched request.
+        self.batch_window = batch_window
+        self.batch_size = batch_size  # flush a batch early at this size
+        self._batches = {}  # index pattern -> [(query_dict, future), ...]
+
         # additional params
         # https://www.elastic.co/guide/en/elasticsearch/reference/current/breaking-changes-7.0.html
         # #hits-total-now-object-search-response
@@ -135,9 +149,12 @@ class AsyncESQueryBackend(ESQueryBackend):
             if options.get('fetch_all'):
                 query = query.extra(size=self.scroll_size)
                 query = query.params(scroll=self.scroll_time)
-            if self.total_hits_as_int:
-                query = query.params(rest_total_hits_as_int=True)
-            res = await self.client.search(body=query.to_dict(), index=index, **query._params)
+            if self.batch_window and not query._params and not options.get('raw'):
+                res = await self._queue_msearch(index, query.to_dict())
+            else:
+                if self.total_hits_as_int:
+                    query = query.params(rest_total_hits_as_int=True)
+                res = await self.client.search(body=query.to_dict(), index=index, **query._params)
 
         elif isinstance(query, MultiSearch):
             await self.semaphore.acquire()
@@ -152,6 +169,80 @@ class AsyncESQueryBackend(ESQueryBackend):
 
         return res
 
+    def _queue_msearch(self, index, query_dict):
+        """
+        Add a query to the pending batch of its index and return a
+        future of its individual response. The first query of a batch
+        schedules a flush after the batching window, a batch reaching
+        self.batch_size flushes immediately.
+        """
+        loop = asyncio.get_event_loop()
+        future = loop.create_future()
+
+        batch = self._batches.get(index)
+        if batch is None:
+            batch = self._batches[index] = []
+            loop.call_later(self.batch_window, self._dispatch_batch, index, batch)
+        batch.append((query_dict, future))
+
+        if len(batch) >= self.batch_size:
+            self._dispatch_batch(index, batch)
+
+        return future
+
+    def _dispatch_batch(self, index, batch):
+        if not batch:
+            return  # already dispatched by the other trigger
+        if self._batches.get(index) is batch:
+            del self._batches[index]
+        entries = list(batch)
+        batch.clear()
+        asyncio.ensure_future(self._msearch(index, entries))
+
+    async def _msearch(self, index, entries):
+        body = []
+        for query_dict, _ in entries:
+            body.append({})  # per-query header, index set on the request
+            body.append(query_dict)
+
+        params = {}
+        if self.total_hits_as_int:
+            params['rest_total_hits_as_int'] = True
+
+        try:
+            res = await self.client.msearch(body=body, index=index, **params)
+        except Exception as exc:
+            for _, future in entries:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for (_, future), response in zip(entries, res['responses']):
+            if future.done():
+                continue
+            if isinstance(response, dict) and 'error' in response:
+                # msearch reports per-query failures inline, translate
+                # them back to the exception a plain search would raise,
+                # using the same status code mapping as the client so
+                # that 400s surface as RequestError and the like, which
+                # the pipeline error handling dispatches on
+                error = response['error']
+                status = response.get('status', 'N/A')
+                kls = HTTP_EXCEPTIONS.get(status, TransportError)
+                try:
+                    exc = kls(
+                        status,
+                        error.get('type') if isinstance(error, dict) else error,
+                        error)
+                except TypeError:  # signature varies across client versions
+                    exc = kls(str(error))
+                future.set_exception(exc)
+            else:
+                # align with what a plain search returns, msearch
+                # sub-responses carry an extra per-query status key
+                response.pop('status', None)
+                future.set_result(response)
+
 
 class MongoQueryBackend():
 
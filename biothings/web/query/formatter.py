@@ -127,6 +127,14 @@ class ESResultFormatter(ResultFormatter):
         self.field_notes = field_notes
         self.excluded_keys = excluded_keys
 
+        # when transform_hit is not customized in a subclass and no
+        # license settings are configured, walking every document
+        # field during transform is a no-op that can be skipped.
+        # licenses may be populated after construction (on metadata
+        # refresh), so only the override check is precomputed here.
+        self._transform_hit_inherited = \
+            type(self).transform_hit is ESResultFormatter.transform_hit
+
     # for compatibility
     traverse = staticmethod(traverse)
 
@@ -186,9 +194,10 @@ class ESResultFormatter(ResultFormatter):
             templates = options.pop('templates', [template]*len(response))
             template_hit = options.pop('template_hit', dict(found=True))
             template_miss = options.pop('template_miss', dict(found=False))
+            with_total = options.with_total
             responses = [self.transform(res, **options) for res in response]
             for tpl, res in zip(templates, responses):
-                if options.with_total:
+                if with_total:
                     total = res.get('total', {}).get('value') or 0
                     if total > max_total:
                         max_total = total
@@ -278,14 +287,22 @@ class ESResultFormatter(ResultFormatter):
             doc.pop('_version', None)
         if not options.get('score', True):
             doc.pop('_score', None)
-        for path, obj in self.traverse(doc):
-            self.transform_hit(path, obj, options)
-            if options.allow_null:
-                self._allow_null(path, obj, options.allow_null)
-            if options.always_list:
-                self._always_list(path, obj, options.always_list)
-            if options._sorted:
-                self._sorted(path, obj)
+        # resolve the dotdict lookups once per document instead of
+        # per traversed node, the values cannot change mid-traversal
+        allow_null = options.allow_null
+        always_list = options.always_list
+        _sorted = options._sorted
+        if not self._transform_hit_inherited or self.licenses \
+                or self.license_transform or allow_null \
+                or always_list or _sorted:
+            for path, obj in self.traverse(doc):
+                self.transform_hit(path, obj, options)
+                if allow_null:
+                    self._allow_null(path, obj, allow_null)
+                if always_list:
+                    self._always_list(path, obj, always_list)
+                if _sorted:
+                    self._sorted(path, obj)
         if options.dotfield:
             self._dotfield(doc, options)
 
@@ -457,15 +474,29 @@ class ESResultFormatter(ResultFormatter):
         items = list(mapping.items())
         items.reverse()
 
+        excluded_keys = self.excluded_keys
         while items:
             key, dic = items.pop()
-            dic = dict(dic)
-            dic.pop('dynamic', None)
-            dic.pop('normalizer', None)
 
             if key in self.field_notes:
                 result['notes'] = self.field_notes[key]
 
+            if 'properties' in dic:
+                subs = (('.'.join((key, k)), v) for k, v in dic['properties'].items())
+                items.extend(reversed(list(subs)))
+
+            # the per-field presentation work below only matters for
+            # fields that pass the filters, which with a prefix or
+            # search parameter is often a small fraction of the index
+            if not all((not excluded_keys or key not in excluded_keys,
+                        not prefix or key.startswith(prefix),
+                        not search or search in key)):
+                continue
+
+            dic = dict(dic)
+            dic.pop('dynamic', None)
+            dic.pop('normalizer', None)
+
             if 'copy_to' in dic:
                 if 'all' in dic['copy_to']:
                     dic['searched_by_default'] = True
@@ -479,14 +510,9 @@ class ESResultFormatter(ResultFormatter):
 
             if 'properties' in dic:
                 dic['type'] = 'object'
-                subs = (('.'.join((key, k)), v) for k, v in dic['properties'].items())
-                items.extend(reversed(list(subs)))
                 del dic['properties']
 
-            if all((not self.excluded_keys or key not in self.excluded_keys,
-                    not prefix or key.startswith(prefix),
-                    not search or search in key)):
-                result[key] = dict(sorted(dic.items()))
+            result[key] = dict(sorted(dic.items()))
 
         return result
 
@@ -1,10 +1,14 @@
 
 import asyncio
+import hashlib
 import logging
-from collections import Counter
+import time
+from collections import Counter, OrderedDict
 from dataclasses import dataclass
+from functools import partial
 
 import elasticsearch
+import orjson
 from biothings.web.query.builder import RawQueryInterrupt
 from biothings.web.query.engine import EndScrollInterrupt, RawResultInterrupt
 
@@ -135,18 +139,115 @@ def capturesESExceptions(func):
                 raise
     return _
 
+class _ESResultCache():
+    """
+    A minimal time-based LRU cache for raw ES responses.
+    Responses are stored serialized so that every cache hit
+    deserializes into a fresh object, because the formatter
+    transforms response structures in place.
+    """
+
+    def __init__(self, maxsize=1024, ttl=60):
+        self.maxsize = maxsize
+        self.ttl = ttl  # in seconds
+        self.data = OrderedDict()  # key -> (expire_at, bytes)
+
+    def get(self, key):
+        entry = self.data.get(key)
+        if entry is None:
+            return None
+        if entry[0] < time.monotonic():
+            del self.data[key]
+            return None
+        self.data.move_to_end(key)
+        return orjson.loads(entry[1])
+
+    def put(self, key, data):  # orjson-serialized response bytes
+        self.data[key] = (time.monotonic() + self.ttl, data)
+        self.data.move_to_end(key)
+        while len(self.data) > self.maxsize:
+            self.data.popitem(last=False)
+
+def _cache_key(query, options):
+    # the built query combined with the queried indices
+    # fully determine the backend response at a point in time
+    data = orjson.dumps(
+        (query.to_dict(), options.get('biothing_type')),
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    return hashlib.blake2b(data, digest_size=16).digest()
+
 class AsyncESQueryPipeline(QueryPipeline):
 
+    def __init__(self, *args, **settings):
+        super().__init__(*args, **settings)
+
+        # result caching is off by default because serving possibly
+        # stale responses is an application-level decision, typically
+        # acceptable for indices only updated by scheduled releases.
+        ttl = self.settings.get("cache_ttl", 0)  # in seconds
+        maxsize = self.settings.get("cache_maxsize", 1024)
+        self.cache = _ESResultCache(maxsize, ttl) if ttl else None
+
+        # identical queries currently in flight, so that concurrent
+        # duplicates (bursts of autocomplete, dashboard polling...)
+        # share one backend call instead of multiplying ES load
+        self._inflight = {}  # key -> future of serialized response
+
+    @staticmethod
+    def _shareable(options):
+        # scroll requests keep server-side states and raw(query)
+        # requests are diagnostic features, none is safe or
+        # worthwhile to share between requests
+        return not any(options.get(key) for key in (
+            'fetch_all', 'scroll_id', 'raw', 'rawquery'))
+
+    async def _execute_shared(self, key, query, options):
+        response = await self.backend.execute(query, **options)
+        # snapshot the response before any awaiting request resumes,
+        # because the formatter transforms responses in place and the
+        # same object must not be handed to multiple requests
+        data = orjson.dumps(response)
+        if self.cache is not None:
+            self.cache.put(key, data)
+        return data
+
     @capturesESExceptions
     async def search(self, q, **options):
 
         if isinstance(q, list):  # multisearch
-            options['templates'] = (dict(query=_q) for _q in q)
+            # materialize the templates up front in one tight loop,
+            # instead of letting the formatter pull them one by one
+            # from a generator interleaved with response processing
+            options['templates'] = tuple(dict(query=_q) for _q in q)
             options['template_miss'] = dict(notfound=True)
             options['template_hit'] = dict()
 
-        query = self.builder.build(q, **options)
-        response = await self.backend.execute(query, **options)
+            # building a multisearch query is CPU-bound and grows with
+            # the number of query terms, run it in the default executor
+            # so that the event loop can service concurrent requests,
+            # overlapping query building with other requests' ES I/O.
+            query = await asyncio.get_event_loop().run_in_executor(
+                None, partial(self.builder.build, q, **options))
+        else:
+            query = self.builder.build(q, **options)
+
+        if self._shareable(options):
+            key = _cache_key(query, options)
+            response = self.cache.get(key) if self.cache is not None else None
+            if response is None:
+                task = self._inflight.get(key)
+                if task is None:
+                    task = asyncio.ensure_future(
+                        self._execute_shared(key, query, options))
+                    self._inflight[key] = task
+                    task.add_done_callback(
+                        lambda _, key=key: self._inflight.pop(key, None))
+                # shield so that one request's cancellation does not
+                # cancel the shared call others are still waiting on
+                response = orjson.loads(await asyncio.shield(task))
+        else:
+            response = await self.backend.execute(query, **options)
+
         result = self.formatter.transform(response, **options)
         return result
 
@@ -155,12 +256,19 @@ class AsyncESQueryPipeline(QueryPipeline):
         if options.get('scopes'):
             raise ValueError("Scopes Not Allowed.")
 
-        # for builder
+        # for builder. note "version" also reaches the builder,
+        # which bakes it into the query as an es keyword, so it
+        # must be set even for rawquery requests to keep the
+        # reported query identical to the one actually executed.
         options['autoscope'] = True
-        # for formatter
         options['version'] = True
-        options['score'] = False
-        options['one'] = True
+
+        if not options.get('rawquery'):
+            # for formatter only. irrelevant for rawquery requests,
+            # which the builder short-circuits with the built
+            # query before the backend and formatter stages run.
+            options['score'] = False
+            options['one'] = True
 
         # annotation endpoint should work on fields with reasonable
         # uniqueness of values, like id and symbol fields. because
@@ -1,5 +1,4 @@
 from elasticsearch import Elasticsearch, AsyncElasticsearch
-from collections import UserDict
 
 class _HCResult():
 
@@ -5,7 +5,6 @@ from datetime import datetime
 from functools import reduce
 from operator import add
 
-import elasticsearch
 from dateutil.parser import parse as dtparse
 
 logger = logging.getLogger(__name__)
@@ -107,7 +107,9 @@ class BiothingsNamespace():
                 self.elasticsearch.async_client,
                 self.config.ES_INDICES,
                 self.config.ES_SCROLL_TIME,
-                self.config.ES_SCROLL_SIZE
+                self.config.ES_SCROLL_SIZE,
+                batch_window=self.config.ES_BATCH_WINDOW,
+                batch_size=self.config.ES_BATCH_SIZE
             ),
             load_class(self.config.ES_RESULT_TRANSFORM)(
                 self.elasticsearch.metadata.biothing_licenses,
@@ -115,7 +117,8 @@ class BiothingsNamespace():
                 self.fieldnote.get_field_notes(),
                 self.config.AVAILABLE_FIELDS_EXCLUDED
             ),
-            fetch_max_match=self.config.ANNOTATION_MAX_MATCH
+            fetch_max_match=self.config.ANNOTATION_MAX_MATCH,
+            cache_ttl=self.config.ES_RESULT_CACHE_TTL
         )
         self.elasticsearch.health = ESHealth(
             self.elasticsearch.async_client,
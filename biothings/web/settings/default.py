@@ -160,6 +160,19 @@ ES_RESULT_TRANSFORM = "biothings.web.query.ESResultFormatter"
 # Pipeline
 # --------
 ANNOTATION_MAX_MATCH = 1000
+# Amount of time in seconds an identical query may be answered
+# from the in-process result cache. 0 disables result caching.
+# Enabling it trades response freshness for repeated-query speed,
+# typically acceptable for indices updated by scheduled releases.
+ES_RESULT_CACHE_TTL = 0
+# Window in seconds during which concurrent single-index searches
+# are merged into one msearch request. 0 disables batching.
+# Enabling it trades up to a window of added latency per request
+# for fewer round trips to elasticsearch under concurrent load.
+ES_BATCH_WINDOW = 0
+# Number of queries that flushes a pending batch before the window
+# elapses. Only effective when ES_BATCH_WINDOW is set.
+ES_BATCH_SIZE = 16
 
 # Builder Stage
 # -------------
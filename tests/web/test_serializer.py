@@ -16,6 +16,10 @@ def test_json_02():
     serializer.to_json([])
     serializer.to_json([{}])
 
+def test_json_03():
+    data = {"key1": "val1", "key2": ["val2", "val3"]}
+    assert serializer.to_json_bytes(data) == serializer.to_json(data).encode()
+
 def test_yaml_01():
     return serializer.to_yaml({
         "key1": "val1",